@@ -1,7 +1,71 @@
 import os
 import json
-from typing import Dict, List, Optional, Any
-from openai import OpenAI
+from typing import TYPE_CHECKING, Dict, List, Optional, Any
+
+if TYPE_CHECKING:
+    from openai import OpenAI
+
+from traditional_approach import TraditionalContactImporter
+
+
+# Instructions for the contact import agent
+SYSTEM_PROMPT = """You are a contact import assistant.
+Goal: read the CSV below and file each contact you can find.
+Use the single tool file_contact(name, email?, phone?) to file each person.
+Infer names and emails/phones from whatever headers or content appear.
+
+You can handle various CSV formats:
+- Different delimiters (comma, semicolon, tab, pipe)
+- With or without headers
+- Different column names and languages
+- Mixed data in cells
+
+For each person you identify, call file_contact with their name and any email/phone you find."""
+
+
+# The single tool exposed to the OpenAI API. Built once at import and shared
+# by every importer instead of being rebuilt per instance.
+TOOL_DEFINITIONS = [
+    {
+        "type": "function",
+        "function": {
+            "name": "file_contact",
+            "description": "Store a single contact record where name is required and at least one of email or phone is provided",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "name": {
+                        "type": "string", 
+                        "description": "Full name of the contact"
+                    },
+                    "email": {
+                        "type": "string", 
+                        "description": "Email address (optional)"
+                    },
+                    "phone": {
+                        "type": "string", 
+                        "description": "Phone number (optional)"
+                    }
+                },
+                "required": ["name"]
+            }
+        }
+    }
+]
+
+
+# OpenAI clients keyed by API key, so every importer reuses one connection pool
+_clients: Dict[str, "OpenAI"] = {}
+
+
+def _get_client(api_key: str) -> "OpenAI":
+    """Return the shared OpenAI client for this API key, creating it on first use."""
+    client = _clients.get(api_key)
+    if client is None:
+        # Imported on first use so ContactStorage alone never loads the SDK
+        from openai import OpenAI
+        client = _clients[api_key] = OpenAI(api_key=api_key)
+    return client
 
 
 class ContactStorage:
@@ -50,7 +114,39 @@ class ContactStorage:
             first_name = name.strip()
             last_name = None
         
-        # Create contact record
+        return self._store(first_name, last_name, email, phone, name)
+    
+    def file_split_contact(self, first_name: Optional[str], last_name: Optional[str],
+                           email: Optional[str] = None, phone: Optional[str] = None) -> Dict[str, Any]:
+        """
+        File a contact whose name is already split into first/last.
+        
+        Used when the columns are known, so a multi-word first name such as
+        "Mary Ann" is kept intact instead of being re-split on whitespace.
+        """
+        first_name = (first_name or "").strip() or None
+        last_name = (last_name or "").strip() or None
+        
+        # Validate required fields
+        if not (first_name or last_name):
+            return {
+                "success": False,
+                "error": "Name is required"
+            }
+        
+        # At least one contact method is required
+        if not email and not phone:
+            return {
+                "success": False,
+                "error": "Either email or phone is required"
+            }
+        
+        name = " ".join(part for part in (first_name, last_name) if part)
+        return self._store(first_name, last_name, email, phone, name)
+    
+    def _store(self, first_name: Optional[str], last_name: Optional[str],
+               email: Optional[str], phone: Optional[str], name: str) -> Dict[str, Any]:
+        """Append a validated contact record and report it."""
         contact = {
             "first_name": first_name,
             "last_name": last_name,
@@ -91,36 +187,17 @@ class AgentContactImporter:
         if not api_key:
             raise ValueError("OPENAI_API_KEY environment variable is required")
         
-        self.client = OpenAI(api_key=api_key)
-        
-        # Define the single tool for the OpenAI API
-        self.tool_definitions = [
-            {
-                "type": "function",
-                "function": {
-                    "name": "file_contact",
-                    "description": "Store a single contact record where name is required and at least one of email or phone is provided",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "name": {
-                                "type": "string", 
-                                "description": "Full name of the contact"
-                            },
-                            "email": {
-                                "type": "string", 
-                                "description": "Email address (optional)"
-                            },
-                            "phone": {
-                                "type": "string", 
-                                "description": "Phone number (optional)"
-                            }
-                        },
-                        "required": ["name"]
-                    }
-                }
-            }
-        ]
+        self.client = _get_client(api_key)
+        
+        # Deterministic importer for the AGENT_FASTPATH shortcut, built once
+        self.local_importer = TraditionalContactImporter()
+        
+        self.tool_definitions = TOOL_DEFINITIONS
+        
+        # Tool name -> bound business logic, one entry per TOOL_DEFINITIONS item
+        self.tool_functions = {
+            "file_contact": self.storage.file_contact,
+        }
     
     def import_contacts(self, csv_text: str, task: str = "Import and file contacts") -> str:
         """
@@ -128,26 +205,21 @@ class AgentContactImporter:
         
         The agent will analyze the CSV structure and use the file_contact tool
         to store each contact it finds.
+        
+        With AGENT_FASTPATH=1, formats the deterministic importer already
+        understands are filed locally and the model is never called.
         """
         
         # Clear previous contacts
         self.storage.clear_contacts()
         
-        system_prompt = """You are a contact import assistant.
-Goal: read the CSV below and file each contact you can find.
-Use the single tool file_contact(name, email?, phone?) to file each person.
-Infer names and emails/phones from whatever headers or content appear.
-
-You can handle various CSV formats:
-- Different delimiters (comma, semicolon, tab, pipe)
-- With or without headers
-- Different column names and languages
-- Mixed data in cells
-
-For each person you identify, call file_contact with their name and any email/phone you find."""
-
+        if os.getenv('AGENT_FASTPATH') == '1':
+            summary = self._import_locally(csv_text)
+            if summary is not None:
+                return summary
+        
         messages = [
-            {"role": "system", "content": system_prompt},
+            {"role": "system", "content": SYSTEM_PROMPT},
             {"role": "user", "content": f"Task: {task}\n\nCSV Data:\n{csv_text}"}
         ]
         
@@ -160,54 +232,63 @@ For each person you identify, call file_contact with their name and any email/ph
         )
         
         message = response.choices[0].message
-        # Convert the message to a dictionary format for the API
-        message_dict = {
-            "role": message.role,
-            "content": message.content,
-        }
-        if message.tool_calls:
-            message_dict["tool_calls"] = [
-                {
-                    "id": tc.id,
-                    "type": tc.type,
-                    "function": {
-                        "name": tc.function.name,
-                        "arguments": tc.function.arguments
-                    }
-                }
-                for tc in message.tool_calls
-            ]
-        messages.append(message_dict)
         
         # Execute tool calls
         if message.tool_calls:
+            results = []
             for tool_call in message.tool_calls:
                 function_name = tool_call.function.name
                 function_args = json.loads(tool_call.function.arguments)
                 
-                # Call the file_contact method
-                if function_name == "file_contact":
-                    result = self.storage.file_contact(**function_args)
+                tool_function = self.tool_functions.get(function_name)
+                if tool_function:
+                    result = tool_function(**function_args)
                 else:
-                    result = {"error": f"Unknown function: {function_name}"}
+                    result = {"success": False, "error": f"Unknown function: {function_name}"}
                 
-                # Add tool result to messages
-                messages.append({
-                "tool_call_id": tool_call.id,
-                "role": "tool",
-                "content": json.dumps(result, ensure_ascii=False)
-                })
+                results.append(result)
             
-            # Get final response
-            final_response = self.client.chat.completions.create(
-                model=os.getenv('OPENAI_MODEL', 'gpt-4o'),
-                messages=messages
+            # The tool results already say what was filed, so summarize them
+            # here instead of paying for a second round-trip to the model
+            return "\n".join(
+                result["message"] if result["success"] else f"Skipped: {result['error']}"
+                for result in results
             )
-            
-            return final_response.choices[0].message.content
         else:
             return message.content
 
+    def _import_locally(self, csv_text: str) -> Optional[str]:
+        """
+        File contacts without the model when the format is a known one.
+        
+        Returns a summary if every row was recognized and at least one was
+        filed, or None if the agent should handle the data instead.
+        """
+        try:
+            contacts = self.local_importer.import_contacts(csv_text)
+        except ValueError:
+            return None
+        
+        if not contacts:
+            return None
+        
+        # Columns are already split, so keep first/last as the importer found them
+        filed = 0
+        for contact in contacts:
+            result = self.storage.file_split_contact(
+                contact['first_name'], contact['last_name'],
+                email=contact['email'], phone=contact['phone']
+            )
+            if result["success"]:
+                filed += 1
+        
+        # Nothing usable was filed, so let the agent look at the data instead
+        if not filed:
+            return None
+        
+        noun = "contact" if filed == 1 else "contacts"
+        return f"Filed {filed} {noun} from a recognized format without calling the model."
+
     def get_contacts(self) -> List[Dict[str, Optional[str]]]:
         """Get all contacts that have been filed."""
         return self.storage.get_contacts()
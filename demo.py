@@ -6,165 +6,276 @@ This script runs the same contact import test cases through both the traditional
 imperative approach and the agent-based approach to show the difference.
 """
 
+import argparse
+import hashlib
 import os
+import shelve
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from traditional_approach import TraditionalContactImporter
-from agent_approach import AgentContactImporter
 
 
-def run_demo():
-    """Run both approaches side by side for comparison."""
-    
-    # Test cases that demonstrate the paradigm difference
-    test_cases = [
-        {
-            "name": "Standard CRM Export",
-            "data": """First Name,Last Name,Email,Phone
+# Where --cache keeps agent results between runs
+AGENT_CACHE_PATH = ".agent_cache"
+
+
+# Fixed demo text, built once at import
+_BANNER = "\n".join([
+    "=" * 80,
+    "CONTACT IMPORTER: TRADITIONAL vs AGENT-BASED PROGRAMMING",
+    "=" * 80,
+    "",
+    "This demo shows the same contact import tasks solved with two approaches:",
+    "1. Traditional Imperative Programming (explicit handling of every format)",
+    "2. Agent-Based Programming (single tool + intelligent delegation)",
+    "",
+])
+
+_KEY_DIFFERENCES = "\n".join([
+    "KEY DIFFERENCES:",
+    "",
+    "Traditional Approach:",
+    "  ✅ No external dependencies",
+    "  ✅ Predictable performance",
+    "  ✅ Works offline",
+    "  ❌ Rigid - only handles pre-programmed column names",
+    "  ❌ Complex branching logic for each delimiter/format",
+    "  ❌ Hard to extend with new languages/formats",
+    "  ❌ Struggles with mixed data formats",
+    "  ❌ Cannot adapt to unexpected CSV structures",
+    "",
+    "Agent Approach:",
+    "  ✅ Flexible - adapts to new CSV structures automatically",
+    "  ✅ Simple business logic (single file_contact tool)",
+    "  ✅ Easy to extend with new tools",
+    "  ✅ Handles international formats and languages",
+    "  ✅ Can extract data from mixed/unstructured fields",
+    "  ✅ Adapts to unexpected column names and formats",
+    "  ❌ Requires API calls (cost/latency)",
+    "  ❌ Less predictable (AI behavior)",
+    "  ❌ Needs internet connection",
+    "",
+    "🚀 The Future: Write simple business logic tools, let agents combine them intelligently!",
+    "",
+    "Notice how the traditional approach requires explicit handling of every",
+    "possible CSV format, delimiter, and column name variation, while the",
+    "agent approach adapts automatically to new formats using the same single tool.",
+])
+
+
+# Test cases that demonstrate the paradigm difference
+_TEST_CASES = [
+    {
+        "name": "Standard CRM Export",
+        "data": """First Name,Last Name,Email,Phone
 John,Doe,john@example.com,555-123-4567
 Jane,Smith,jane@test.org,555-987-6543""",
-            "task": "Import standard contact list"
-        },
-        {
-            "name": "Combined Name Field",
-            "data": """Full Name,Email Address,Work Phone
+        "task": "Import standard contact list"
+    },
+    {
+        "name": "Combined Name Field",
+        "data": """Full Name,Email Address,Work Phone
 John Doe,john@example.com,(555) 123-4567
 Jane Smith,jane@test.org,555.987.6543""",
-            "task": "Import contacts with combined names"
-        },
-        {
-            "name": "International Format (Spanish)",
-            "data": """Nombre,Apellidos,Correo,Teléfono
+        "task": "Import contacts with combined names"
+    },
+    {
+        "name": "International Format (Spanish)",
+        "data": """Nombre,Apellidos,Correo,Teléfono
 Luis,García,luis@empresa.es,+34 91 123 4567
 María,López,maria@test.es,+34 93 987 6543""",
-            "task": "Import Spanish contact list"
-        },
-        {
-            "name": "Pipe-Delimited No Headers",
-            "data": """John Doe|john@example.com|555-123-4567
+        "task": "Import Spanish contact list"
+    },
+    {
+        "name": "Pipe-Delimited No Headers",
+        "data": """John Doe|john@example.com|555-123-4567
 Jane Smith|jane@test.org|555-987-6543""",
-            "task": "Import pipe-delimited data without headers"
-        },
-        {
-            "name": "Mixed Format with Notes",
-            "data": """Contact,Primary Info,Notes
+        "task": "Import pipe-delimited data without headers"
+    },
+    {
+        "name": "Mixed Format with Notes",
+        "data": """Contact,Primary Info,Notes
 John Doe,john@example.com,Phone: 555-123-4567 Company: Acme
 Jane Smith,Call 555-987-6543,Email: jane@test.org""",
-            "task": "Import contacts with mixed data in notes"
-        },
-        {
-            "name": "Unexpected Legacy System Export",
-            "data": """"Contact Info","Details","Extra"
+        "task": "Import contacts with mixed data in notes"
+    },
+    {
+        "name": "Unexpected Legacy System Export",
+        "data": """"Contact Info","Details","Extra"
 "Smith, Jane (Manager)","jane.smith@company.com | Mobile: +1-555-0123","Dept: Sales, Start: 2020"
 "Rodriguez, Carlos","carlos.r@email.com Phone: 555.987.6543","Engineering Team Lead\"""",
-            "task": "Import contacts from messy legacy system export"
-        }
-    ]
+        "task": "Import contacts from messy legacy system export"
+    }
+]
+
+
+def _format_contact(contact):
+    """Format a contact as 'Name | email | phone' for display."""
+    name = f"{contact['first_name'] or ''} {contact['last_name'] or ''}".strip()
+    return f"{name} | {contact['email'] or 'No email'} | {contact['phone'] or 'No phone'}"
+
+
+def _import_with_agent(test_case):
+    """Run one test case through its own agent importer (safe to call from a thread)."""
+    from agent_approach import AgentContactImporter
+    
+    importer = AgentContactImporter()
+    result = importer.import_contacts(test_case['data'], test_case['task'])
+    return result, importer.get_contacts()
+
+
+def _cache_key(test_case):
+    """Key an agent run by its task, CSV data, model and fast-path setting."""
+    model = os.getenv('OPENAI_MODEL', 'gpt-4o')
+    fastpath = os.getenv('AGENT_FASTPATH') == '1'
+    raw = f"{model}\x00{fastpath}\x00{test_case['task']}\x00{test_case['data']}".encode()
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+def _case_numbers(value):
+    """Parse a comma-separated list of test case numbers, e.g. '1,3,5'."""
+    try:
+        numbers = [int(part) for part in value.split(",") if part.strip()]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected comma-separated case numbers, got {value!r}")
+    
+    if not numbers:
+        raise argparse.ArgumentTypeError("expected at least one case number")
+    for number in numbers:
+        if not 1 <= number <= len(_TEST_CASES):
+            raise argparse.ArgumentTypeError(
+                f"no test case {number}; choose from 1-{len(_TEST_CASES)}"
+            )
+    return numbers
+
+
+def run_demo(use_cache=False, only="both", cases=None):
+    """
+    Run both approaches side by side for comparison.
+    
+    With use_cache, agent results from earlier runs on identical data are
+    reused instead of calling the API again. only ("both", "traditional" or
+    "agent") skips the other approach entirely, and cases limits the run to
+    the given 1-based test case numbers.
+    """
+    
+    # Keep the original numbering so a subset still prints its real case numbers
+    selected = [(i, tc) for i, tc in enumerate(_TEST_CASES, 1) if not cases or i in cases]
     
-    print("=" * 80)
-    print("CONTACT IMPORTER: TRADITIONAL vs AGENT-BASED PROGRAMMING")
-    print("=" * 80)
-    print()
-    print("This demo shows the same contact import tasks solved with two approaches:")
-    print("1. Traditional Imperative Programming (explicit handling of every format)")
-    print("2. Agent-Based Programming (single tool + intelligent delegation)")
-    print()
+    print(_BANNER)
     
     # Initialize processors
     traditional = TraditionalContactImporter()
     
     # Check if we can run agent approach
-    if not os.getenv('OPENAI_API_KEY'):
+    if only == "traditional":
+        agent_enabled = False
+    elif not os.getenv('OPENAI_API_KEY'):
         print("⚠️  OPENAI_API_KEY not found - skipping agent approach")
         print("   Create a .env file with your API key to see the full comparison")
         print()
-        agent = None
+        agent_enabled = False
     else:
         try:
-            agent = AgentContactImporter()
+            # Imported here so runs without a key never load the OpenAI SDK.
+            # Built once only so setup errors surface before any case runs;
+            # each case gets its own importer in _import_with_agent.
+            from agent_approach import AgentContactImporter
+            AgentContactImporter()
+            agent_enabled = True
         except Exception as e:
             print(f"⚠️  Could not initialize agent: {e}")
-            agent = None
+            agent_enabled = False
     
-    for i, test_case in enumerate(test_cases, 1):
-        print(f"TEST CASE {i}: {test_case['name']}")
-        print(f"Task: {test_case['task']}")
-        print(f"Data: {test_case['data'][:60]}...")
-        print()
+    # Start every agent import up front so the API round-trips overlap;
+    # results are still printed in test-case order below
+    agent_runs = {}
+    cache_keys = {}
+    cached = {}
+    fresh = {}
+    if agent_enabled and selected:
+        if use_cache:
+            cache_keys = {i: _cache_key(tc) for i, tc in selected}
+            with shelve.open(AGENT_CACHE_PATH) as cache:
+                cached = {i: cache[key] for i, key in cache_keys.items() if key in cache}
         
-        # Traditional approach
-        print("🔧 TRADITIONAL APPROACH:")
-        try:
-            contacts = traditional.import_contacts(test_case['data'], test_case['task'])
-            print("   Results:")
-            for j, contact in enumerate(contacts, 1):
-                # Format contact nicely
-                name = f"{contact['first_name'] or ''} {contact['last_name'] or ''}".strip()
-                email = contact['email'] or 'No email'
-                phone = contact['phone'] or 'No phone'
-                print(f"     {j}. {name} | {email} | {phone}")
-        except Exception as e:
-            print(f"   Result: ❌ Error - {e}")
+        pending = [(i, tc) for i, tc in selected if i not in cached]
+        if pending:
+            executor = ThreadPoolExecutor(max_workers=len(pending))
+            agent_runs = {i: executor.submit(_import_with_agent, tc) for i, tc in pending}
+            executor.shutdown(wait=False)
+    
+    for i, test_case in selected:
+        # Collect the whole block and write it once per test case
+        out = [
+            f"TEST CASE {i}: {test_case['name']}",
+            f"Task: {test_case['task']}",
+            f"Data: {test_case['data'][:60]}...",
+            "",
+        ]
         
-        print()
+        # Traditional approach
+        if only != "agent":
+            out.append("🔧 TRADITIONAL APPROACH:")
+            try:
+                contacts = traditional.import_contacts(test_case['data'], test_case['task'])
+                out.append("   Results:")
+                out.extend(f"     {j}. {_format_contact(c)}" for j, c in enumerate(contacts, 1))
+            except Exception as e:
+                out.append(f"   Result: ❌ Error - {e}")
+            
+            if only == "both":
+                out.append("")
         
         # Agent approach
-        if agent:
-            print("🤖 AGENT APPROACH:")
+        if agent_enabled:
+            out.append("🤖 AGENT APPROACH:")
             try:
-                result = agent.import_contacts(test_case['data'], test_case['task'])
-                print("   Agent Response:")
+                if i in cached:
+                    result, contacts = cached[i]
+                else:
+                    result, contacts = agent_runs[i].result()
+                    if use_cache:
+                        fresh[cache_keys[i]] = (result, contacts)
+                out.append("   Agent Response:")
                 # Format the agent's response nicely
-                lines = result.split('\n')
-                for line in lines:
-                    if line.strip():
-                        print(f"     {line}")
+                out.extend(f"     {line}" for line in result.splitlines() if line.strip())
                 
                 # Show the contacts that were actually filed
-                contacts = agent.get_contacts()
-                print(f"   \n   Contacts Filed ({len(contacts)}):")
-                for j, contact in enumerate(contacts, 1):
-                    name = f"{contact['first_name'] or ''} {contact['last_name'] or ''}".strip()
-                    email = contact['email'] or 'No email'
-                    phone = contact['phone'] or 'No phone'
-                    print(f"     {j}. {name} | {email} | {phone}")
-                    
+                out.append(f"   \n   Contacts Filed ({len(contacts)}):")
+                out.extend(f"     {j}. {_format_contact(c)}" for j, c in enumerate(contacts, 1))
             except Exception as e:
-                print(f"   Result: ❌ Error - {e}")
-        else:
-            print("🤖 AGENT APPROACH: (Skipped - no API key)")
+                out.append(f"   Result: ❌ Error - {e}")
+        elif only != "traditional":
+            out.append("🤖 AGENT APPROACH: (Skipped - no API key)")
         
-        print()
-        print("-" * 80)
-        print()
+        out.extend(["", "-" * 80, ""])
+        sys.stdout.write("\n".join(out) + "\n")
+    
+    if fresh:
+        with shelve.open(AGENT_CACHE_PATH) as cache:
+            cache.update(fresh)
     
-    print("KEY DIFFERENCES:")
-    print()
-    print("Traditional Approach:")
-    print("  ✅ No external dependencies")
-    print("  ✅ Predictable performance")
-    print("  ✅ Works offline")
-    print("  ❌ Rigid - only handles pre-programmed column names")
-    print("  ❌ Complex branching logic for each delimiter/format")
-    print("  ❌ Hard to extend with new languages/formats")
-    print("  ❌ Struggles with mixed data formats")
-    print("  ❌ Cannot adapt to unexpected CSV structures")
-    print()
-    print("Agent Approach:")
-    print("  ✅ Flexible - adapts to new CSV structures automatically")
-    print("  ✅ Simple business logic (single file_contact tool)")
-    print("  ✅ Easy to extend with new tools")
-    print("  ✅ Handles international formats and languages")
-    print("  ✅ Can extract data from mixed/unstructured fields")
-    print("  ✅ Adapts to unexpected column names and formats")
-    print("  ❌ Requires API calls (cost/latency)")
-    print("  ❌ Less predictable (AI behavior)")
-    print("  ❌ Needs internet connection")
-    print()
-    print("🚀 The Future: Write simple business logic tools, let agents combine them intelligently!")
-    print()
-    print("Notice how the traditional approach requires explicit handling of every")
-    print("possible CSV format, delimiter, and column name variation, while the")
-    print("agent approach adapts automatically to new formats using the same single tool.")
+    print(_KEY_DIFFERENCES)
 
 
 if __name__ == "__main__":
-    run_demo()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Compare the traditional and agent contact importers.")
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help=f"reuse agent results from earlier runs on the same data (stored in {AGENT_CACHE_PATH})"
+    )
+    parser.add_argument(
+        "--only",
+        choices=["both", "traditional", "agent"],
+        default="both",
+        help="run just one approach (traditional never calls the API)"
+    )
+    parser.add_argument(
+        "--cases",
+        type=_case_numbers,
+        help="comma-separated test case numbers to run, e.g. 1,3,5"
+    )
+    args = parser.parse_args()
+    run_demo(use_cache=args.cache, only=args.only, cases=args.cases)
\ No newline at end of file
@@ -1,10 +1,15 @@
 #!/usr/bin/env python3
 """Integration tests for the demo script."""
 
-import unittest
+import argparse
+import io
 import os
+import tempfile
+import unittest
+import pytest
+from contextlib import redirect_stdout
 from unittest.mock import patch
-from demo import run_demo
+from demo import _case_numbers, run_demo
 
 
 class TestDemoIntegration(unittest.TestCase):
@@ -12,13 +17,65 @@ class TestDemoIntegration(unittest.TestCase):
     
     def test_demo_runs_without_api_key(self):
         """Test that demo runs gracefully without OpenAI API key."""
-        with patch.dict(os.environ, {}, clear=True):
+        with patch.dict(os.environ):
+            os.environ.pop("OPENAI_API_KEY", None)
             # Should not raise an exception
             try:
                 run_demo()
             except Exception as e:
                 self.fail(f"Demo should run without API key, but raised: {e}")
     
+    def test_demo_reuses_cached_agent_results(self):
+        """Test that --cache serves repeat runs without calling the agent again."""
+        with tempfile.TemporaryDirectory() as tmp, \
+                patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}), \
+                patch("demo.AGENT_CACHE_PATH", os.path.join(tmp, "agent_cache")), \
+                patch("demo._import_with_agent", return_value=("Filed contact: Test User", [])) as agent_run, \
+                redirect_stdout(io.StringIO()):
+            run_demo(use_cache=True)
+            calls = agent_run.call_count
+            run_demo(use_cache=True)
+        
+        self.assertGreater(calls, 0)
+        self.assertEqual(agent_run.call_count, calls)
+    
+    def test_demo_cache_is_keyed_by_model_and_fastpath(self):
+        """Test that changing OPENAI_MODEL or AGENT_FASTPATH does not reuse cached results."""
+        with tempfile.TemporaryDirectory() as tmp, \
+                patch.dict(os.environ, {"OPENAI_API_KEY": "test-key", "OPENAI_MODEL": "model-a", "AGENT_FASTPATH": "0"}), \
+                patch("demo.AGENT_CACHE_PATH", os.path.join(tmp, "agent_cache")), \
+                patch("demo._import_with_agent", return_value=("Filed contact: Test User", [])) as agent_run, \
+                redirect_stdout(io.StringIO()):
+            run_demo(use_cache=True, cases=[1])
+            os.environ["OPENAI_MODEL"] = "model-b"
+            run_demo(use_cache=True, cases=[1])
+            os.environ["AGENT_FASTPATH"] = "1"
+            run_demo(use_cache=True, cases=[1])
+        
+        self.assertEqual(agent_run.call_count, 3)
+    
+    def test_demo_only_traditional_skips_agent(self):
+        """Test that --only traditional never runs the agent, even with a key."""
+        output = io.StringIO()
+        with patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}), \
+                patch("demo._import_with_agent") as agent_run, \
+                redirect_stdout(output):
+            run_demo(only="traditional", cases=[1, 3])
+        
+        agent_run.assert_not_called()
+        self.assertNotIn("AGENT APPROACH", output.getvalue())
+        self.assertIn("TEST CASE 3", output.getvalue())
+        self.assertNotIn("TEST CASE 2", output.getvalue())
+    
+    def test_case_numbers_must_name_existing_cases(self):
+        """Test that --cases rejects numbers outside the list of test cases."""
+        self.assertEqual(_case_numbers("1,3"), [1, 3])
+        for value in ("9", "0,-1", ",", "x"):
+            with self.subTest(value=value):
+                with self.assertRaises(argparse.ArgumentTypeError):
+                    _case_numbers(value)
+    
+    @pytest.mark.integration
     def test_demo_runs_with_real_api_key(self):
         """Integration test: Demo runs with real OpenAI API key."""
         api_key = os.getenv('OPENAI_API_KEY')
@@ -27,7 +84,8 @@ class TestDemoIntegration(unittest.TestCase):
         
         # Should not raise an exception and should make real API calls
         try:
-            run_demo()
+            with patch.dict(os.environ, {"AGENT_FASTPATH": "0"}):
+                run_demo()
         except Exception as e:
             self.fail(f"Demo should run with real API key, but raised: {e}")
     
@@ -46,6 +104,7 @@ Jane,Smith,jane@test.org"""
         self.assertEqual(contacts[0]["first_name"], "John")
         self.assertEqual(contacts[0]["email"], "john@example.com")
     
+    @pytest.mark.integration
     def test_agent_approach_works_with_api_key(self):
         """Test that agent approach works with API key."""
         api_key = os.getenv('OPENAI_API_KEY')
@@ -58,7 +117,9 @@ Jane,Smith,jane@test.org"""
         csv_data = """Name,Email
 Test User,test@example.com"""
         
-        result = importer.import_contacts(csv_data, "Test import")
+        # Pin the fast path off so the model really files the contact
+        with patch.dict(os.environ, {"AGENT_FASTPATH": "0"}):
+            result = importer.import_contacts(csv_data, "Test import")
         
         # Should get a response
         self.assertIsInstance(result, str)
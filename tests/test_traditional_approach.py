@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Tests for the traditional contact importer."""
 
+import time
 import unittest
 from traditional_approach import TraditionalContactImporter
 
@@ -8,8 +9,10 @@ from traditional_approach import TraditionalContactImporter
 class TestTraditionalContactImporter(unittest.TestCase):
     """Test the traditional imperative contact importer."""
     
-    def setUp(self):
-        self.importer = TraditionalContactImporter()
+    @classmethod
+    def setUpClass(cls):
+        # The importer keeps no per-import state, so one instance serves every test
+        cls.importer = TraditionalContactImporter()
     
     def test_import_standard_csv(self):
         """Test importing standard CSV with headers."""
@@ -67,18 +70,46 @@ María,López,maria@test.es,+34 93 987 6543"""
     
     def test_normalize_phone(self):
         """Test phone number normalization."""
+        cases = [
+            ("5551234567", "(555) 123-4567"),
+            ("15551234567", "+1 (555) 123-4567"),
+            ("+34 91 123 4567", "+34 91 123 4567"),
+            ("555-1234", None),
+            ("Acme", None),
+        ]
+        normalize = self.importer._normalize_phone
+        for raw, expected in cases:
+            with self.subTest(raw=raw):
+                self.assertEqual(normalize(raw), expected)
+    
+    def test_email_pattern(self):
+        """Test email extraction from mixed cells."""
+        pattern = self.importer.email_pattern
         self.assertEqual(
-            self.importer._normalize_phone("5551234567"),
-            "(555) 123-4567"
-        )
-        self.assertEqual(
-            self.importer._normalize_phone("15551234567"),
-            "+1 (555) 123-4567"
-        )
-        self.assertEqual(
-            self.importer._normalize_phone("+34 91 123 4567"),
-            "+34 91 123 4567"
+            pattern.search("jane.smith@company.com | Mobile: +1-555-0123").group("email"),
+            "jane.smith@company.com"
         )
+        self.assertEqual(pattern.search("x@mail.example.co.uk").group("email"), "x@mail.example.co.uk")
+        self.assertIsNone(pattern.search("john@example.c|m"))
+        
+        # Punctuation leading into the address is not part of it
+        self.assertEqual(pattern.search("Email:.jane@test.org").group("email"), "jane@test.org")
+        self.assertEqual(pattern.search("...john@x.com").group("email"), "john@x.com")
+        self.assertEqual(pattern.search("-john@x.com").group("email"), "john@x.com")
+    
+    def test_find_email_skips_leading_punctuation(self):
+        """Test that filed emails never keep punctuation from the cell."""
+        contacts = self.importer.import_contacts("Name,Email\nJohn Doe,...john@x.com")
+        
+        self.assertEqual(contacts[0]["email"], "john@x.com")
+    
+    def test_email_pattern_is_linear_on_long_runs(self):
+        """Test that a long dotted run without a valid email is rejected quickly."""
+        pattern = self.importer.email_pattern
+        for text in ("a@" + "a." * 20000 + "1", "a." * 20000 + "1"):
+            start = time.perf_counter()
+            self.assertIsNone(pattern.search(text))
+            self.assertLess(time.perf_counter() - start, 0.5)
     
     def test_detect_delimiter(self):
         """Test delimiter detection."""
@@ -86,6 +117,7 @@ María,López,maria@test.es,+34 93 987 6543"""
         self.assertEqual(self.importer._detect_delimiter("a;b;c"), ";")
         self.assertEqual(self.importer._detect_delimiter("a\tb\tc"), "\t")
         self.assertEqual(self.importer._detect_delimiter("a|b|c"), "|")
+        self.assertEqual(self.importer._detect_delimiter('"Smith, Jane"|"a, b"|c'), "|")
     
     def test_header_normalization(self):
         """Test header normalization with synonyms."""
@@ -96,6 +128,16 @@ María,López,maria@test.es,+34 93 987 6543"""
         self.assertEqual(normalized[1], "last_name")
         self.assertEqual(normalized[2], "email")
     
+    def test_header_synonyms_can_be_extended(self):
+        """Test that synonyms added to the table are used for normalization."""
+        importer = TraditionalContactImporter()
+        importer.header_synonyms["email"].append("courriel")
+        
+        normalized = importer._normalize_headers(["Courriel"], importer.header_synonyms)
+        
+        self.assertEqual(normalized, ["email"])
+        self.assertTrue(importer._looks_like_headers(["Courriel"]))
+    
     def test_unexpected_format_breaks_traditional(self):
         """Test that traditional approach breaks on unexpected formats."""
         # This format breaks the traditional approach
@@ -21,10 +21,22 @@ class TraditionalContactImporter:
     combination of CSV format, column names, delimiters, and data structures.
     """
     
+    # Compiled once for the class rather than on every instantiation.
+    # Email domains are dot-separated labels so the engine never has to guess
+    # which '.' starts the TLD (and '|' is no longer accepted in the TLD).
+    # A match only starts where a run of local-part characters starts, so
+    # search() never retries from every position inside a long run; leading
+    # punctuation in the run is skipped and left out of the 'email' group.
+    email_pattern = re.compile(
+        r'(?<![A-Za-z0-9._%+-])[._%+-]*'
+        r'(?P<email>[A-Za-z0-9][A-Za-z0-9._%+-]*@(?:[A-Za-z0-9-]+\.)+[A-Za-z]{2,})\b'
+    )
+    phone_pattern = re.compile(r'\+?[\d\s\-\(\)\.]{10,}')
+    non_digit_pattern = re.compile(r'\D')
+    # Quoted cells may contain any delimiter; drop them before counting
+    quoted_field_pattern = re.compile(r'"[^"]*"')
+    
     def __init__(self):
-        self.email_pattern = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
-        self.phone_pattern = re.compile(r'\+?[\d\s\-\(\)\.]{10,}')
-        
         # Header synonyms - must maintain mappings for every language and variation
         self.header_synonyms = {
             "first_name": ["first", "first name", "given", "nombre", "prenom", "vorname"],
@@ -50,12 +62,14 @@ class TraditionalContactImporter:
         # Step 3: Process each row
         out = []
         for row in table["rows"]:
+            # Map canonical header -> cell once; every helper reads from it
+            row_dict = dict(zip(headers, row))
             try:
                 # Infer name using explicit rules
-                first, last = self._infer_name(row, headers)
+                first, last = self._infer_name(row_dict)
                 
                 # Find email with fallback logic
-                email = self._find_email(row, headers, fallback_to_notes=True)
+                email = self._find_email(row, row_dict, fallback_to_notes=True)
                 
                 # Check for missing required data
                 if not (first or last) or not email:
@@ -65,7 +79,7 @@ class TraditionalContactImporter:
                     "first_name": first,
                     "last_name": last,
                     "email": email,
-                    "phone": self._find_phone(row, headers)
+                    "phone": self._find_phone(row, row_dict)
                 })
                 
             except ValueError as e:
@@ -102,7 +116,7 @@ class TraditionalContactImporter:
     
     def _detect_delimiter(self, text: str) -> str:
         """Detect delimiter with explicit rules."""
-        first_line = text.split('\n')[0] if text else ""
+        first_line = self.quoted_field_pattern.sub('', text.partition('\n')[0])
         
         # Count each delimiter type
         comma_count = first_line.count(',')
@@ -138,25 +152,24 @@ class TraditionalContactImporter:
     
     def _normalize_headers(self, headers: List[str], using: Dict[str, List[str]]) -> List[str]:
         """Normalize headers using synonym mappings."""
+        # Flatten the synonym table into one variant -> canonical lookup;
+        # the first canonical field listing a variant wins. Rebuilt per call
+        # so synonyms added to header_synonyms take effect immediately.
+        lookup = {}
+        for canonical, variants in using.items():
+            lookup.setdefault(canonical, canonical)
+            for variant in variants:
+                lookup.setdefault(variant, canonical)
+        
         normalized = []
         for h in headers:
             key = h.strip().lower()
-            best = None
-            
-            # Check each canonical field for matches
-            for canonical, variants in using.items():
-                if key in variants or key == canonical:
-                    best = canonical
-                    break
-            
-            normalized.append(best or key)  # Hope for the best if no match
+            normalized.append(lookup.get(key, key))  # Hope for the best if no match
         
         return normalized
     
-    def _infer_name(self, row: List[str], headers: List[str]) -> Tuple[Optional[str], Optional[str]]:
+    def _infer_name(self, row_dict: Dict[str, str]) -> Tuple[Optional[str], Optional[str]]:
         """Infer name with explicit branching logic."""
-        row_dict = dict(zip(headers, row))
-        
         # Try to find explicit first/last name fields
         first = row_dict.get("first_name")
         last = row_dict.get("last_name")
@@ -182,16 +195,14 @@ class TraditionalContactImporter:
         
         return None, None
     
-    def _find_email(self, row: List[str], headers: List[str], fallback_to_notes: bool = False) -> Optional[str]:
+    def _find_email(self, row: List[str], row_dict: Dict[str, str], fallback_to_notes: bool = False) -> Optional[str]:
         """Find email with explicit field checking."""
-        row_dict = dict(zip(headers, row))
-        
         # Check explicit email field
         email = row_dict.get("email")
         if email and "@" in email:
             match = self.email_pattern.search(email)
             if match:
-                return match.group(0)
+                return match.group('email')
         
         # Fallback to searching all fields if enabled
         if fallback_to_notes:
@@ -199,14 +210,12 @@ class TraditionalContactImporter:
                 if value and "@" in value:
                     match = self.email_pattern.search(value)
                     if match:
-                        return match.group(0)
+                        return match.group('email')
         
         return None
     
-    def _find_phone(self, row: List[str], headers: List[str]) -> Optional[str]:
+    def _find_phone(self, row: List[str], row_dict: Dict[str, str]) -> Optional[str]:
         """Find phone with explicit field checking."""
-        row_dict = dict(zip(headers, row))
-        
         # Check explicit phone field
         phone = row_dict.get("phone")
         if phone:
@@ -225,11 +234,13 @@ class TraditionalContactImporter:
     
     def _normalize_phone(self, value: str) -> Optional[str]:
         """Normalize phone number with explicit formatting rules."""
-        if not value:
+        # Every accepted format needs at least 10 digits, so shorter values
+        # (names, emails, IDs) can be rejected before any regex work
+        if not value or len(value) < 10:
             return None
         
         # Extract digits only
-        digits = re.sub(r'\D', '', value)
+        digits = self.non_digit_pattern.sub('', value)
         
         # Explicit formatting based on digit count
         if len(digits) == 10: